@@ -7,168 +7,476 @@ with accurate indentation and formatting. Useful for situations where standard
 Ctrl+V doesn't work properly or when you need precise character-by-character pasting.
 
 Usage:
-    python prokeys.py [--delay DELAY] [--trigger-key KEY]
+    python prokeys.py [--delay DELAY] [--trigger-key KEY] [--paste-mode]
 
 Options:
     --delay DELAY        Delay between keystrokes in seconds (default: 0.01)
     --trigger-key KEY    Key combination to trigger pasting (default: cmd+shift+v)
+    --paste-mode         Paste via clipboard + Cmd/Ctrl+V instead of typing
     --help              Show this help message
 """
 
-import argparse
+import bisect
+import hashlib
 import time
 import sys
 import threading
 import json
 import os
+import queue
+import re
+import shutil
+import struct
+import subprocess
+from functools import reduce
+from itertools import groupby
+from operator import or_
+from types import MappingProxyType
 from typing import Optional
 
-try:
-    import pyperclip
-    import pynput
-    from pynput import keyboard
-    from pynput.keyboard import Key, Listener, KeyCode
-    import pyautogui
-except ImportError as e:
-    print(f"Missing required dependencies: {e}")
-    print("Please install them using: pip install pyperclip pynput pyautogui")
-    sys.exit(1)
+# Keyboard and clipboard libraries, imported on first use by _load_input_libs
+pyperclip = pyautogui = Quartz = None
+Key = Listener = Controller = None
 
 
-CONFIG_FILE = "prokeys_config.json"
+CONFIG_FILE = "prokeys_config.bin"
+LEGACY_CONFIG_FILE = "prokeys_config.json"
+
+# Binary config layout: wpm, delay, windows_mode, NUL-padded UTF-8 trigger key
+_CONFIG_STRUCT = struct.Struct('<Id?32s')
+
+# Modifier for the system paste shortcut
+_PASTE_MODIFIER = 'cmd' if sys.platform == 'darwin' else 'ctrl'
+
+# On Linux/X11 the paste shortcut is sent with xdotool when available (one process
+# call instead of several events through python-xlib)
+_XDOTOOL = shutil.which('xdotool') if sys.platform.startswith('linux') else None
+# Seconds to wait for xdotool before giving up (it can hang if the X display is unreachable)
+_XDOTOOL_TIMEOUT = 2.0
+
+# Parsed config and the file mtime it was read at (see load_config)
+_CFG_CACHE = None
+_CFG_MTIME = 0
+
+# Shared pynput keyboard Controller (see _get_controller)
+_KEYBOARD_CONTROLLER = None
 
 # macOS US Keyboard Layout Character Mapping
-# Maps characters to their corresponding base key and required modifiers
+# Maps characters to their corresponding base key and whether Shift is required
 MACOS_KEY_MAPPING = {
     # Shift + Number row special characters
-    '!': ('1', [Key.shift]),
-    '@': ('2', [Key.shift]),
-    '#': ('3', [Key.shift]),
-    '$': ('4', [Key.shift]),
-    '%': ('5', [Key.shift]),
-    '^': ('6', [Key.shift]),
-    '&': ('7', [Key.shift]),
-    '*': ('8', [Key.shift]),
-    '(': ('9', [Key.shift]),
-    ')': ('0', [Key.shift]),
+    '!': ('1', True),
+    '@': ('2', True),
+    '#': ('3', True),
+    '$': ('4', True),
+    '%': ('5', True),
+    '^': ('6', True),
+    '&': ('7', True),
+    '*': ('8', True),
+    '(': ('9', True),
+    ')': ('0', True),
     
     # Uppercase letters (A-Z)
-    'A': ('a', [Key.shift]), 'B': ('b', [Key.shift]), 'C': ('c', [Key.shift]), 'D': ('d', [Key.shift]),
-    'E': ('e', [Key.shift]), 'F': ('f', [Key.shift]), 'G': ('g', [Key.shift]), 'H': ('h', [Key.shift]),
-    'I': ('i', [Key.shift]), 'J': ('j', [Key.shift]), 'K': ('k', [Key.shift]), 'L': ('l', [Key.shift]),
-    'M': ('m', [Key.shift]), 'N': ('n', [Key.shift]), 'O': ('o', [Key.shift]), 'P': ('p', [Key.shift]),
-    'Q': ('q', [Key.shift]), 'R': ('r', [Key.shift]), 'S': ('s', [Key.shift]), 'T': ('t', [Key.shift]),
-    'U': ('u', [Key.shift]), 'V': ('v', [Key.shift]), 'W': ('w', [Key.shift]), 'X': ('x', [Key.shift]),
-    'Y': ('y', [Key.shift]), 'Z': ('z', [Key.shift]),
+    'A': ('a', True), 'B': ('b', True), 'C': ('c', True), 'D': ('d', True),
+    'E': ('e', True), 'F': ('f', True), 'G': ('g', True), 'H': ('h', True),
+    'I': ('i', True), 'J': ('j', True), 'K': ('k', True), 'L': ('l', True),
+    'M': ('m', True), 'N': ('n', True), 'O': ('o', True), 'P': ('p', True),
+    'Q': ('q', True), 'R': ('r', True), 'S': ('s', True), 'T': ('t', True),
+    'U': ('u', True), 'V': ('v', True), 'W': ('w', True), 'X': ('x', True),
+    'Y': ('y', True), 'Z': ('z', True),
     
     # Additional special characters that require shift
-    '_': ('-', [Key.shift]),  # Underscore: Shift + Hyphen
-    '+': ('=', [Key.shift]),  # Plus: Shift + Equals
-    '{': ('[', [Key.shift]),  # Left brace: Shift + Left bracket
-    '}': (']', [Key.shift]),  # Right brace: Shift + Right bracket
-    '|': ('\\', [Key.shift]), # Pipe: Shift + Backslash
-    ':': (';', [Key.shift]),  # Colon: Shift + Semicolon
-    '"': ("'", [Key.shift]),  # Double quote: Shift + Single quote
-    '<': (',', [Key.shift]),  # Less than: Shift + Comma
-    '>': ('.', [Key.shift]),  # Greater than: Shift + Period
-    '?': ('/', [Key.shift]),  # Question mark: Shift + Slash
-    '~': ('`', [Key.shift]),  # Tilde: Shift + Backtick
+    '_': ('-', True),  # Underscore: Shift + Hyphen
+    '+': ('=', True),  # Plus: Shift + Equals
+    '{': ('[', True),  # Left brace: Shift + Left bracket
+    '}': (']', True),  # Right brace: Shift + Right bracket
+    '|': ('\\', True), # Pipe: Shift + Backslash
+    ':': (';', True),  # Colon: Shift + Semicolon
+    '"': ("'", True),  # Double quote: Shift + Single quote
+    '<': (',', True),  # Less than: Shift + Comma
+    '>': ('.', True),  # Greater than: Shift + Period
+    '?': ('/', True),  # Question mark: Shift + Slash
+    '~': ('`', True),  # Tilde: Shift + Backtick
     
     # Numbers (no modifiers needed)
-    '0': ('0', []), '1': ('1', []), '2': ('2', []), '3': ('3', []), '4': ('4', []),
-    '5': ('5', []), '6': ('6', []), '7': ('7', []), '8': ('8', []), '9': ('9', []),
+    '0': ('0', False), '1': ('1', False), '2': ('2', False), '3': ('3', False), '4': ('4', False),
+    '5': ('5', False), '6': ('6', False), '7': ('7', False), '8': ('8', False), '9': ('9', False),
     
     # Lowercase letters (no modifiers needed)
-    'a': ('a', []), 'b': ('b', []), 'c': ('c', []), 'd': ('d', []), 'e': ('e', []),
-    'f': ('f', []), 'g': ('g', []), 'h': ('h', []), 'i': ('i', []), 'j': ('j', []),
-    'k': ('k', []), 'l': ('l', []), 'm': ('m', []), 'n': ('n', []), 'o': ('o', []),
-    'p': ('p', []), 'q': ('q', []), 'r': ('r', []), 's': ('s', []), 't': ('t', []),
-    'u': ('u', []), 'v': ('v', []), 'w': ('w', []), 'x': ('x', []), 'y': ('y', []),
-    'z': ('z', []),
+    'a': ('a', False), 'b': ('b', False), 'c': ('c', False), 'd': ('d', False), 'e': ('e', False),
+    'f': ('f', False), 'g': ('g', False), 'h': ('h', False), 'i': ('i', False), 'j': ('j', False),
+    'k': ('k', False), 'l': ('l', False), 'm': ('m', False), 'n': ('n', False), 'o': ('o', False),
+    'p': ('p', False), 'q': ('q', False), 'r': ('r', False), 's': ('s', False), 't': ('t', False),
+    'u': ('u', False), 'v': ('v', False), 'w': ('w', False), 'x': ('x', False), 'y': ('y', False),
+    'z': ('z', False),
     
     # Basic punctuation (no modifiers needed)
-    ' ': (' ', []),           # Space
-    '-': ('-', []),           # Hyphen
-    '=': ('=', []),           # Equals
-    '[': ('[', []),           # Left bracket
-    ']': (']', []),           # Right bracket
-    '\\': ('\\', []),         # Backslash
-    ';': (';', []),           # Semicolon
-    "'": ("'", []),           # Single quote
-    ',': (',', []),           # Comma
-    '.': ('.', []),           # Period
-    '/': ('/', []),           # Slash
-    '`': ('`', []),           # Backtick
+    ' ': (' ', False),           # Space
+    '-': ('-', False),           # Hyphen
+    '=': ('=', False),           # Equals
+    '[': ('[', False),           # Left bracket
+    ']': (']', False),           # Right bracket
+    '\\': ('\\', False),         # Backslash
+    ';': (';', False),           # Semicolon
+    "'": ("'", False),           # Single quote
+    ',': (',', False),           # Comma
+    '.': ('.', False),           # Period
+    '/': ('/', False),           # Slash
+    '`': ('`', False),           # Backtick
 }
 
+# Expected mapping entry for each Shift + number symbol, checked by test_character_mapping
+_SHIFT_NUM_TESTS = {
+    '!': ('1', True), '@': ('2', True), '#': ('3', True), '$': ('4', True), '%': ('5', True),
+    '^': ('6', True), '&': ('7', True), '*': ('8', True), '(': ('9', True), ')': ('0', True),
+}
 
+# Characters typed with dedicated keys rather than the mapping; never reported as unsupported
+_CONTROL_CHARS = frozenset('\n\t')
 
-def wpm_to_delay(wpm: int) -> float:
-    """Convert WPM to delay between keystrokes in seconds.
+# Base keys are tapped as single characters; check the table once here rather than per keystroke
+assert all(len(base) == 1 for base, _ in MACOS_KEY_MAPPING.values()), "MACOS_KEY_MAPPING base keys must be single characters"
+
+# MACOS_KEY_MAPPING entries indexed by ord(char) for the ASCII fast path (None if unmapped)
+_ASCII_KEY_MAP = tuple(MACOS_KEY_MAPPING.get(chr(o)) for o in range(128))
+
+# Run kinds for splitting text into batches: plain mapped keys, Shift + key, anything else
+_RUN_PLAIN, _RUN_SHIFT, _RUN_OTHER = 0, 1, 2
+_RUN_KIND = {char: _RUN_SHIFT if shift else _RUN_PLAIN for char, (_, shift) in MACOS_KEY_MAPPING.items()}
+
+# Shifted character for each base key ('v' -> 'V', '1' -> '!'), so trigger keys match with Shift held
+_SHIFTED_CHAR = {base: char for char, (base, shift) in MACOS_KEY_MAPPING.items() if shift}
+
+def _run_kind(char: str) -> int:
+    """Run kind of char (see _RUN_KIND)."""
+    return _RUN_KIND.get(char, _RUN_OTHER)
+
+# macOS ANSI virtual key codes for the base keys used in MACOS_KEY_MAPPING
+MACOS_KEY_CODES = {
+    'a': 0x00, 's': 0x01, 'd': 0x02, 'f': 0x03, 'h': 0x04, 'g': 0x05, 'z': 0x06, 'x': 0x07,
+    'c': 0x08, 'v': 0x09, 'b': 0x0B, 'q': 0x0C, 'w': 0x0D, 'e': 0x0E, 'r': 0x0F, 'y': 0x10,
+    't': 0x11, '1': 0x12, '2': 0x13, '3': 0x14, '4': 0x15, '6': 0x16, '5': 0x17, '=': 0x18,
+    '9': 0x19, '7': 0x1A, '-': 0x1B, '8': 0x1C, '0': 0x1D, ']': 0x1E, 'o': 0x1F, 'u': 0x20,
+    '[': 0x21, 'i': 0x22, 'p': 0x23, 'l': 0x25, 'j': 0x26, "'": 0x27, 'k': 0x28, ';': 0x29,
+    '\\': 0x2A, ',': 0x2B, '/': 0x2C, 'n': 0x2D, 'm': 0x2E, '.': 0x2F, ' ': 0x31, '`': 0x32,
+}
+
+# Characters resolved once to (virtual key code, needs_shift) for type_content_fast
+_QUARTZ_KEYS = {char: (MACOS_KEY_CODES[base], shift) for char, (base, shift) in MACOS_KEY_MAPPING.items()}
+_QUARTZ_KEYS['\n'] = (0x24, False)  # Return
+_QUARTZ_KEYS['\t'] = (0x30, False)  # Tab
+
+# Matches any line that starts with indentation (4 spaces or a tab)
+_INDENTED_LINE_RE = re.compile(r'^(?:    |\t)', re.MULTILINE)
+
+# Splits leading whitespace into runs of tabs and runs of other (typed as space) characters
+_INDENT_RUN_RE = re.compile(r'\t+|[^\t]+')
+
+# Number of recent clipboard contents whose typing plans are kept (see ProKeys._typing_plan)
+_PLAN_CACHE_SIZE = 4
+
+
+def _pace(deadline: float, step: float) -> float:
+    """Wait until step seconds past the previous deadline and return the new deadline.
+    
+    Waiting on a cumulative deadline keeps the average keystroke rate on target
+    even though each time.sleep overshoots. Sub-millisecond steps (see
+    _SPIN_WAIT_DELAY) are too short for time.sleep, so only those busy-wait.
+    After a stall the schedule restarts from now instead of bursting keys to
+    catch up.
+    """
+    deadline = max(deadline, time.perf_counter() - step) + step
+    if step <= _SPIN_WAIT_DELAY:
+        while time.perf_counter() < deadline:
+            pass
+    else:
+        remaining = deadline - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+    return deadline
+
+def _iter_lines(content: str):
+    """Yield the newline-separated lines of content one at a time, like split('\\n') without the list."""
+    pos = 0
+    while True:
+        end = content.find('\n', pos)
+        if end < 0:
+            yield content[pos:]
+            return
+        yield content[pos:end]
+        pos = end + 1
+
+def type_content_fast(content: str, delay: float) -> bool:
+    """Type content by posting CoreGraphics keyboard events directly.
+    
+    Returns False without typing anything if Quartz is unavailable or the
+    content has characters outside the key mapping.
+    """
+    if Quartz is None:
+        return False
+    
+    try:
+        keys = [_QUARTZ_KEYS[char] for char in content]
+    except KeyError:
+        return False
+    
+    create_event = Quartz.CGEventCreateKeyboardEvent
+    set_flags = Quartz.CGEventSetFlags
+    post = Quartz.CGEventPost
+    tap = Quartz.kCGHIDEventTap
+    shift_flag = Quartz.kCGEventFlagMaskShift
+    deadline = time.perf_counter()
+    
+    for key_code, needs_shift in keys:
+        key_down = create_event(None, key_code, True)
+        key_up = create_event(None, key_code, False)
+        if needs_shift:
+            set_flags(key_down, shift_flag)
+            set_flags(key_up, shift_flag)
+        post(tap, key_down)
+        post(tap, key_up)
+        if delay > 0:
+            deadline = _pace(deadline, delay)
+    
+    return True
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for ProKeys._dbg when debug output is off."""
+
+def _debug_print(*args):
+    """Print a debug message with the [DEBUG] prefix."""
+    print("[DEBUG]", *args)
+
+def _load_input_libs() -> None:
+    """Import the keyboard and clipboard libraries into the module globals.
+    
+    Deferred until a ProKeys instance is created, so config-only commands
+    (config, --show-config) start without loading pyautogui and pynput.
+    """
+    global pyperclip, pyautogui, Quartz, Key, Listener, Controller
+    if pyautogui is not None:
+        return
+    try:
+        import pyperclip
+        from pynput.keyboard import Key, Listener, Controller
+        import pyautogui
+    except ImportError as e:
+        print(f"Missing required dependencies: {e}")
+        print("Please install them using: pip install pyperclip pynput pyautogui")
+        sys.exit(1)
+    
+    try:
+        # Optional: direct CoreGraphics event posting on macOS (pyobjc, installed with pyautogui)
+        import Quartz
+    except ImportError:
+        Quartz = None
+
+def _get_controller() -> 'Controller':
+    """Return the shared pynput keyboard Controller, creating it on first use."""
+    global _KEYBOARD_CONTROLLER
+    if _KEYBOARD_CONTROLLER is None:
+        _KEYBOARD_CONTROLLER = Controller()
+    return _KEYBOARD_CONTROLLER
+
+def _post_unicode_chunk(text: str, utf16_len: int) -> None:
+    """Post one key down/up pair carrying text as its Unicode payload."""
+    for key_down in (True, False):
+        event = Quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+        Quartz.CGEventKeyboardSetUnicodeString(event, utf16_len, text)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+
+def type_unicode_fast(content: str, delay: float) -> bool:
+    """Type content as Unicode strings attached to CoreGraphics keyboard events.
+    
+    Bypasses per-character key code lookup, so any character can be typed.
+    Text is sent in chunks of at most 20 UTF-16 units (the most macOS delivers
+    per event), with newlines sent as Return. Returns False if Quartz is unavailable.
+    """
+    if Quartz is None:
+        return False
+    
+    deadline = time.perf_counter()
+    for line_num, line in enumerate(content.split('\n')):
+        if line_num > 0:
+            type_content_fast('\n', 0)
+            if delay > 0:
+                deadline = _pace(deadline, delay)
+        
+        chunk_start = 0
+        units = 0
+        for i, char in enumerate(line):
+            char_units = 2 if ord(char) > 0xFFFF else 1
+            if units + char_units > 20:
+                _post_unicode_chunk(line[chunk_start:i], units)
+                if delay > 0:
+                    deadline = _pace(deadline, delay * (i - chunk_start))
+                chunk_start = i
+                units = 0
+            units += char_units
+        
+        if units:
+            _post_unicode_chunk(line[chunk_start:], units)
+            if delay > 0:
+                deadline = _pace(deadline, delay * (len(line) - chunk_start))
+    
+    return True
+
+
+# Overhead multipliers by WPM band: < 60 minimal, < 120 some, < 200 more, 200+ significant
+_WPM_BANDS = (60, 120, 200)
+_WPM_OVERHEAD = (1.2, 1.3, 1.4, 1.5)
+
+def _compute_wpm_delay(wpm: int) -> float:
+    """Compute the delay between keystrokes in seconds for a WPM.
     
     More realistic calculation accounting for:
     - Natural typing rhythm
     - Application processing time  
     - Keystroke simulation overhead
     """
-    # Base calculation: 60 / (WPM * 5) but adjusted for realism
+    # Base calculation: 60 / (WPM * 5), plus 20-50% overhead depending on speed
     base_delay = 60.0 / (wpm * 5)
-    
-    # Add realistic overhead (20-50% depending on speed)
-    if wpm < 60:
-        # Slower speeds: minimal overhead
-        return base_delay * 1.2
-    elif wpm < 120:
-        # Moderate speeds: some overhead
-        return base_delay * 1.3
-    elif wpm < 200:
-        # Fast speeds: more overhead needed
-        return base_delay * 1.4
-    else:
-        # Very fast speeds: significant overhead
-        return base_delay * 1.5
+    return base_delay * _WPM_OVERHEAD[bisect.bisect_right(_WPM_BANDS, wpm)]
+
+def _estimate_delay_wpm(delay: float) -> int:
+    """Estimate WPM for a delay outside the lookup table range."""
+    # Invert _compute_wpm_delay: wpm = base_wpm * overhead, using the overhead of
+    # the band the result lands in, so the estimate joins the table at both edges
+    base_wpm = 60.0 / (delay * 5)
+    band = len(_WPM_BANDS)
+    while band and base_wpm * _WPM_OVERHEAD[band] < _WPM_BANDS[band - 1]:
+        band -= 1
+    return int(round(base_wpm * _WPM_OVERHEAD[band]))
+
+# Precomputed delays for every valid WPM (see validate_wpm), plus the same
+# table sorted by delay for reverse lookups
+_WPM_DELAY = {wpm: _compute_wpm_delay(wpm) for wpm in range(99, 5001)}
+_DELAY_TABLE = sorted((delay, wpm) for wpm, delay in _WPM_DELAY.items())
+_DELAYS_SORTED = [delay for delay, _ in _DELAY_TABLE]
+
+# Keystroke delays at or below this are paced by busy-waiting: sub-millisecond
+# steps are shorter than time.sleep's wake-up granularity. Configured speeds
+# (up to 5000 WPM, ~3.6ms) always sleep; only a small --delay override spins.
+_SPIN_WAIT_DELAY = 0.001
+
+# Characters written per deadline wait at spin-wait speeds (see ProKeys._write_bursts)
+_PACED_BURST = 16
+
+def wpm_to_delay(wpm: int) -> float:
+    """Convert WPM to delay between keystrokes in seconds."""
+    delay = _WPM_DELAY.get(wpm)
+    return delay if delay is not None else _compute_wpm_delay(wpm)
 
 def delay_to_wpm(delay: float) -> int:
-    """Convert delay to WPM (approximate reverse calculation)."""
+    """Convert delay to WPM (nearest table entry, approximate outside the valid range)."""
     if delay <= 0:
         return 9999
     
-    # Reverse calculation accounting for overhead
-    # This is approximate since the original calculation has variable overhead
-    base_wpm = 60.0 / (delay * 5)
+    if not _DELAYS_SORTED[0] <= delay <= _DELAYS_SORTED[-1]:
+        return _estimate_delay_wpm(delay)
     
-    # Estimate overhead and adjust
-    if delay > 0.3:  # Corresponds to ~40 WPM
-        return int(base_wpm / 1.2)
-    elif delay > 0.15:  # Corresponds to ~80 WPM  
-        return int(base_wpm / 1.3)
-    elif delay > 0.08:  # Corresponds to ~150 WPM
-        return int(base_wpm / 1.4)
-    else:
-        return int(base_wpm / 1.5)
+    i = bisect.bisect_left(_DELAYS_SORTED, delay)
+    if i > 0 and delay - _DELAYS_SORTED[i - 1] < _DELAYS_SORTED[i] - delay:
+        i -= 1
+    return _DELAY_TABLE[i][1]
+
+# Configuration used when no config file can be read (read-only; load_config returns copies)
+_DEFAULT_CONFIG = MappingProxyType({
+    "typing_speed_wpm": 250,
+    "delay": wpm_to_delay(250),
+    "trigger_key": "cmd+shift+v",
+    "windows_mode": False
+})
+
+def _pack_config(config: dict) -> bytes:
+    """Pack a config dict into the binary config layout."""
+    trigger_key = config["trigger_key"].encode('utf-8')
+    if len(trigger_key) > 32:
+        raise ValueError(f"trigger key too long ({len(trigger_key)} bytes, max 32)")
+    return _CONFIG_STRUCT.pack(
+        config["typing_speed_wpm"],
+        config["delay"],
+        config.get("windows_mode", False),
+        trigger_key,
+    )
+
+def _unpack_config(data: bytes) -> dict:
+    """Unpack the binary config layout into a config dict."""
+    wpm, delay, windows_mode, trigger_key = _CONFIG_STRUCT.unpack(data)
+    return {
+        "typing_speed_wpm": wpm,
+        "delay": delay,
+        "trigger_key": trigger_key.rstrip(b'\0').decode('utf-8'),
+        "windows_mode": windows_mode
+    }
+
+def _migrate_legacy_config() -> Optional[dict]:
+    """Convert an old JSON config file to the binary format."""
+    try:
+        with open(LEGACY_CONFIG_FILE, 'rb') as f:
+            legacy = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Error reading legacy config: {e}")
+        return None
+    if not isinstance(legacy, dict):
+        print("Error reading legacy config: expected a JSON object")
+        return None
+    
+    # Older files may lack keys; fill them from the defaults, keeping the
+    # delay in step with a saved WPM
+    config = dict(_DEFAULT_CONFIG)
+    config.update(legacy)
+    if "delay" not in legacy and "typing_speed_wpm" in legacy:
+        config["delay"] = wpm_to_delay(config["typing_speed_wpm"])
+    
+    if save_config(config):
+        try:
+            os.remove(LEGACY_CONFIG_FILE)
+        except OSError as e:
+            print(f"Error removing legacy config: {e}")
+    return config
 
 def load_config() -> dict:
     """Load configuration from config file."""
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
-        except Exception:
-            pass
-    
+    global _CFG_CACHE, _CFG_MTIME
+
+    try:
+        st = os.stat(CONFIG_FILE)
+        if st.st_mtime == _CFG_MTIME and _CFG_CACHE is not None:
+            return _CFG_CACHE.copy()
+
+        with open(CONFIG_FILE, 'rb') as f:
+            config = _unpack_config(f.read())
+        _CFG_CACHE = config
+        _CFG_MTIME = st.st_mtime
+        return config.copy()
+    except FileNotFoundError:
+        # No binary config yet: migrate an old JSON one if there is one
+        config = _migrate_legacy_config()
+        if config is not None:
+            return config
+    except (struct.error, UnicodeDecodeError):
+        pass  # Corrupt or truncated config file; use the defaults
+    except OSError as e:
+        print(f"Error reading config: {e}")
+
     # Default configuration
-    return {
-        "typing_speed_wpm": 250,
-        "delay": wpm_to_delay(250),
-        "trigger_key": "cmd+shift+v",
-        "windows_mode": False
-    }
+    return dict(_DEFAULT_CONFIG)
 
 def save_config(config: dict) -> bool:
     """Save configuration to file."""
+    global _CFG_CACHE, _CFG_MTIME
+
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        data = _pack_config(config)
+        with open(CONFIG_FILE, 'wb') as f:
+            f.write(data)
+        # Keep the in-process cache in sync so the next load skips the re-read
+        _CFG_CACHE = dict(config)
+        _CFG_MTIME = os.stat(CONFIG_FILE).st_mtime
         return True
     except Exception as e:
         print(f"Error saving config: {e}")
@@ -178,17 +486,21 @@ def validate_wpm(wpm: int) -> bool:
     """Validate WPM is in acceptable range."""
     return 99 <= wpm <= 5000
 
-def set_typing_speed(wpm: int) -> bool:
-    """Set typing speed in WPM."""
+def set_typing_speed(wpm: int, config: Optional[dict] = None) -> bool:
+    """Set typing speed in WPM, updating config (loaded from file when None)."""
     if not validate_wpm(wpm):
         print(f"❌ Error: WPM must be between 99 and 5000. Got: {wpm}")
         return False
     
-    config = load_config()
+    if config is None:
+        config = load_config()
+    delay = wpm_to_delay(wpm)
+    # Only write the file when the speed actually changes
+    unchanged = config.get("typing_speed_wpm") == wpm and config.get("delay") == delay
     config["typing_speed_wpm"] = wpm
-    config["delay"] = wpm_to_delay(wpm)
+    config["delay"] = delay
     
-    if save_config(config):
+    if unchanged or save_config(config):
         print(f"✅ Typing speed set to {wpm} WPM")
         print(f"   Delay between keystrokes: {config['delay']:.4f} seconds")
         
@@ -282,7 +594,7 @@ def interactive_config():
                 continue
             
             if validate_wpm(wpm):
-                if set_typing_speed(wpm):
+                if set_typing_speed(wpm, config):
                     print("\n✅ Configuration updated successfully!")
                     return
                 else:
@@ -299,37 +611,84 @@ def interactive_config():
 
 
 class ProKeys:
-    def __init__(self, delay: float = 0.01, trigger_key: str = "cmd+shift+v", windows_mode: bool = False, debug: bool = False):
+    def __init__(self, delay: float = 0.01, trigger_key: str = "cmd+shift+v", windows_mode: bool = False, debug: bool = False, paste_mode: bool = False):
+        _load_input_libs()
+        
         self.delay = delay
+        # _write_paced: PyAutoGUI write paced on the keystroke deadline instead of its
+        # per-character sleep, specialized for the delay once instead of branching per write
+        if delay <= 0:
+            self._write_paced = pyautogui.write
+        elif delay <= _SPIN_WAIT_DELAY:
+            self._write_paced = self._write_bursts
+        else:
+            self._write_paced = self._write_each
         self.trigger_key = trigger_key
         self.windows_mode = windows_mode
+        self.paste_mode = paste_mode
+        # Paste shortcut modifier, resolved once for _type_content_clipboard
+        self._paste_modifier = Key.cmd if _PASTE_MODIFIER == 'cmd' else Key.ctrl
         self.debug = debug
+        # Debug output goes through _dbg, a no-op unless debug is on
+        self._dbg = _debug_print if debug else _noop
+        # Whether the in-place progress line needs ending (see _show_progress)
+        self._progress_open = False
+        # Deadline of the last keystroke slot (see _wait_next)
+        self._next_tick = 0.0
+        # Optional settle time around Shift down/up, for apps that drop fast modifier changes
+        self.modifier_sleep = 0.0
         
         # Initialize both keyboard controllers for hybrid approach
-        from pynput.keyboard import Controller
-        self.keyboard_controller = Controller()  # For indentation handling
+        self.keyboard_controller = _get_controller()  # Indentation, navigation, mapped keys and paste
         
         # Use pynput for input listening (works well)
         self.listener = None
         self.running = False
+        # Typing plans for recently typed content, oldest first (see _typing_plan)
+        self._plan_cache = {}
+        # Trigger requests from the listener to the worker thread (see start_listening);
+        # one slot, so triggers arriving mid-paste collapse into a single follow-up paste
+        self._trigger_queue = queue.Queue(maxsize=1)
         self.trigger_keys = self._parse_trigger_key(trigger_key)
-        self.pressed_keys = set()
+        
+        # Every trigger key is tracked as a bit so the trigger check is a single mask compare;
+        # left and right modifier variants share a bit, other trigger keys get their own
+        # (the generic Key.ctrl etc. are distinct keys on Windows, aliases elsewhere)
+        self._key_bit = {
+            Key.ctrl: 1, Key.ctrl_l: 1, Key.ctrl_r: 1,
+            Key.shift: 2, Key.shift_l: 2, Key.shift_r: 2,
+            Key.alt: 4, Key.alt_l: 4, Key.alt_r: 4,
+            Key.cmd: 8, Key.cmd_l: 8, Key.cmd_r: 8,
+        }
+        other_keys = sorted((k for k in self.trigger_keys if k not in self._key_bit), key=str)
+        for i, k in enumerate(other_keys):
+            self._key_bit[k] = 16 << i
+            if k in _SHIFTED_CHAR:
+                # Also map the shifted form so key events never need .lower()
+                self._key_bit[_SHIFTED_CHAR[k]] = 16 << i
+        self._trigger_mask = reduce(or_, (self._key_bit[k] for k in self.trigger_keys), 0)
+        # Bits whose press can complete the trigger: the non-modifier keys (above the four
+        # modifier bits), like a regular shortcut, or every trigger key for modifier-only combinations
+        self._trigger_last_bits = self._trigger_mask & ~0b1111 or self._trigger_mask
+        self._pressed_mask = 0
         
         # Configure PyAutoGUI for output (works better for character generation)
-        pyautogui.PAUSE = 0.01  # Small pause between operations
+        pyautogui.PAUSE = 0  # No implicit pause; typing paths sleep explicitly where needed
         pyautogui.FAILSAFE = True  # Safety feature
         
-        if self.debug:
-            print("[DEBUG] ProKeys initialized with hybrid approach - pynput + PyAutoGUI")
+        self._dbg("ProKeys initialized with hybrid approach - pynput + PyAutoGUI")
         
         
-    def _parse_trigger_key(self, trigger_key: str) -> set:
-        """Parse trigger key combination string into a set of keys."""
+    def _parse_trigger_key(self, trigger_key: str) -> frozenset:
+        """Parse trigger key combination string into a frozenset of keys."""
         key_mapping = {
-            'ctrl': Key.ctrl_l,
-            'shift': Key.shift_l,
-            'alt': Key.alt_l,
+            'ctrl': Key.ctrl,
+            'control': Key.ctrl,
+            'shift': Key.shift,
+            'alt': Key.alt,
+            'option': Key.alt,
             'cmd': Key.cmd,  # Use Key.cmd (not cmd_l)
+            'command': Key.cmd,
             'super': Key.cmd,
             'win': Key.cmd,
         }
@@ -345,8 +704,9 @@ class ProKeys:
                 # For letter keys, store as lowercase character
                 parsed_keys.add(key.lower())
             elif len(key) == 1:
-                # For other single characters (numbers, symbols)
-                parsed_keys.add(key)
+                # For other single characters (numbers, symbols), store the unshifted key
+                entry = MACOS_KEY_MAPPING.get(key)
+                parsed_keys.add(entry[0] if entry else key)
             else:
                 # Handle special keys like 'space', 'enter', etc.
                 try:
@@ -354,7 +714,7 @@ class ProKeys:
                 except AttributeError:
                     print(f"Warning: Unknown key '{key}' in trigger combination")
         
-        return parsed_keys
+        return frozenset(parsed_keys)
     
     def get_clipboard_content(self) -> str:
         """Get content from clipboard."""
@@ -376,10 +736,11 @@ class ProKeys:
         
         # Small delay before starting to type
         time.sleep(0.5)
+        self._next_tick = time.perf_counter()
         
         try:
-            if self.windows_mode:
-                # Use clipboard-based approach for Windows mode (most reliable)
+            if self.windows_mode or self.paste_mode:
+                # Use clipboard-based approach for Windows/paste mode (most reliable, one keystroke)
                 self._type_content_clipboard(content)
             else:
                 # Use macOS-specific character-by-character typing with proper key combinations
@@ -397,39 +758,28 @@ class ProKeys:
                 print(f"✗ Fallback method also failed: {fallback_error}")
     
     def _type_content_clipboard(self, content: str) -> None:
-        """Type content using clipboard + Ctrl+V method (most reliable for Windows virtual desktop)."""
-        if self.debug:
-            print("[DEBUG] Using clipboard-based input method")
+        """Type content using clipboard + Ctrl+V method (most reliable for Windows virtual desktop).
+        
+        Args:
+            content: The content to paste; put on the clipboard first unless it
+                is already there
+        """
+        self._dbg("Using clipboard-based input method")
         
         try:
-            # Store original clipboard content
-            original_clipboard = ""
-            try:
-                original_clipboard = pyperclip.paste()
-            except:
-                pass  # Ignore if clipboard is empty or inaccessible
-            
-            # Set our content to clipboard
-            pyperclip.copy(content)
-            
-            # Short delay to ensure clipboard is set
-            time.sleep(0.1)
-            
-            # Send Cmd+V to paste (macOS)
-            if self.debug:
-                print("[DEBUG] Sending Cmd+V to paste content")
+            # The clipboard may have changed since it was read; a trigger's own
+            # content is normally still there, so the copy is usually skipped
+            if pyperclip.paste() != content:
+                self._dbg("Clipboard changed, setting it to the content")
+                pyperclip.copy(content)
             
-            pyautogui.hotkey('cmd', 'v')
+            # Send Cmd+V (macOS) / Ctrl+V (elsewhere) to paste
+            self._dbg(f"Sending {_PASTE_MODIFIER}+V to paste content")
             
-            # Wait for paste to complete
-            time.sleep(0.2)
-            
-            # Restore original clipboard content
-            try:
-                if original_clipboard:
-                    pyperclip.copy(original_clipboard)
-            except:
-                pass  # Ignore if restoration fails
+            if not self._paste_with_xdotool():
+                controller = self.keyboard_controller
+                with controller.pressed(self._paste_modifier):
+                    controller.tap('v')
             
             print(f"✓ Successfully pasted {len(content)} characters using clipboard method!")
             
@@ -437,367 +787,323 @@ class ProKeys:
             print(f"✗ Clipboard method failed: {e}")
             raise  # Re-raise to trigger fallback
     
-    def _type_character_macos(self, char: str) -> bool:
-        """Type a single character using PyAutoGUI for macOS.
+    def _type_content_unicode_fallback(self, content: str) -> None:
+        """Fallback method using Unicode CoreGraphics events, or key-by-key pynput typing.
         
-        Args:
-            char: The character to type
-            
-        Returns:
-            bool: True if character was typed successfully, False otherwise
+        type_content runs this once, after the primary method failed; that is
+        usually PyAutoGUI, so it is not tried again here.
         """
-        try:
-            # Check if we have a mapping for this character
-            if char in MACOS_KEY_MAPPING:
-                base_key, modifiers = MACOS_KEY_MAPPING[char]
-                
-                if self.debug:
-                    modifier_names = [str(mod).split('.')[-1] for mod in modifiers]
-                    print(f"[DEBUG] Typing '{char}' using mapping: {base_key} + {modifier_names if modifier_names else 'none'}")
-                
-                if Key.shift in modifiers:
-                    # Use PyAutoGUI hotkey for shift combinations
-                    try:
-                        pyautogui.hotkey('shift', base_key)
-                        if self.debug:
-                            print(f"[DEBUG] Successfully typed '{char}' using PyAutoGUI hotkey")
-                        return True
-                    except Exception as e:
-                        if self.debug:
-                            print(f"[DEBUG] PyAutoGUI hotkey failed for '{char}': {e}")
-                        return False
-                elif modifiers:
-                    # Handle other modifiers (not implemented yet, but structure ready)
-                    if self.debug:
-                        print(f"[DEBUG] Other modifier combinations not yet implemented")
-                    return False
-                else:
-                    # No modifiers needed, just press the base key
-                    try:
-                        pyautogui.press(base_key)
-                        if self.debug:
-                            print(f"[DEBUG] Successfully typed base key '{base_key}' using PyAutoGUI")
-                        return True
-                    except Exception as e:
-                        if self.debug:
-                            print(f"[DEBUG] PyAutoGUI press failed for '{base_key}': {e}")
-                        return False
-                
-            else:
-                # Character not in mapping - NO FALLBACK, return False
-                if self.debug:
-                    print(f"[DEBUG] Character '{char}' not in mapping - no fallback, skipping")
-                return False
-                
-        except Exception as e:
-            if self.debug:
-                print(f"[DEBUG] Failed to type character '{char}': {e}")
-            return False
-    
-    
-    def _type_content_unicode_fallback(self, content: str) -> None:
-        """Fallback method using PyAutoGUI write function."""
-        if self.debug:
-            print("[DEBUG] Using PyAutoGUI write fallback method")
+        self._dbg("Using Unicode / key-by-key fallback method")
         
         try:
-            # Use PyAutoGUI write function as fallback
-            pyautogui.write(content, interval=self.delay)
+            # Attach the text to CoreGraphics events directly when possible
+            if type_unicode_fast(content, self.delay):
+                print(f"✓ Successfully typed {len(content)} characters using Unicode events!")
+                return
             
-            print(f"✓ Successfully typed {len(content)} characters using PyAutoGUI write method!")
+            self._type_content_character_fallback(content)
             
         except Exception as e:
-            print(f"✗ PyAutoGUI write fallback method failed: {e}")
+            print(f"✗ Key-by-key fallback method failed: {e}")
             raise
     
     def _type_content_macos(self, content: str) -> None:
         """macOS-optimized typing that avoids system interference while handling IDE auto-indentation."""
-        if self.debug:
-            print("[DEBUG] Using smart typing method with IDE auto-indent handling")
+        self._dbg("Using smart typing method with IDE auto-indent handling")
         
         # Check if content has multiple lines (likely code that needs smart indentation)
-        if '\n' in content and any(line.startswith('    ') or line.startswith('\t') for line in content.split('\n')):
-            if self.debug:
-                print("[DEBUG] Multi-line content with indentation detected, using smart line-by-line method")
-            self._type_content_smart_lines(content)
+        plan = self._typing_plan(content)
+        if plan is not None:
+            self._dbg("Multi-line content with indentation detected, using smart line-by-line method")
+            self._type_content_smart_lines(content, plan)
         else:
-            if self.debug:
-                print("[DEBUG] Simple content, using direct write method")
-            try:
-                # Use PyAutoGUI write method for simple content
-                pyautogui.write(content, interval=self.delay)
-                print(f"✓ Successfully typed {len(content)} characters using PyAutoGUI write method!")
-            except Exception as e:
-                if self.debug:
-                    print(f"[DEBUG] PyAutoGUI write failed: {e}, falling back to unicode fallback")
-                self._type_content_unicode_fallback(content)
+            self._dbg("Simple content, using direct write method")
+            # Post CoreGraphics events directly when possible
+            if type_content_fast(content, self.delay):
+                print(f"✓ Successfully typed {len(content)} characters using CoreGraphics events!")
+                return
+            
+            # Use PyAutoGUI write method for simple content; failures go to
+            # type_content's single fallback
+            self._write_paced(content)
+            print(f"✓ Successfully typed {len(content)} characters using PyAutoGUI write method!")
+    
+    def _show_progress(self, done: int, total: int) -> None:
+        """Update the progress line in place (carriage return, no newline)."""
+        sys.stdout.write(f"\rProgress: {done}/{total} characters typed")
+        sys.stdout.flush()
+        self._progress_open = True
+    
+    def _end_progress(self) -> None:
+        """Finish the progress line, if one was shown, so later output starts on a new line."""
+        if self._progress_open:
+            sys.stdout.write("\n")
+            self._progress_open = False
+    
+    def _wait_next(self, units: int = 1) -> None:
+        """Wait for the keystroke slot units delays after the previous one."""
+        self._next_tick = _pace(self._next_tick, self.delay * units)
+    
+    def _write_text(self, text: str) -> None:
+        """Type a run of text, via CoreGraphics events when possible, else PyAutoGUI."""
+        if not type_content_fast(text, self.delay):
+            self._write_paced(text)
+    
+    def _write_bursts(self, text: str) -> None:
+        """_write_paced at spin-wait speeds: short bursts, each paced as a whole."""
+        # Too fast to wait between single keys
+        for i in range(0, len(text), _PACED_BURST):
+            burst = text[i:i + _PACED_BURST]
+            pyautogui.write(burst)
+            self._wait_next(len(burst))
+    
+    def _write_each(self, text: str) -> None:
+        """_write_paced at normal speeds: one deadline wait per character."""
+        for char in text:
+            pyautogui.write(char)
+            self._wait_next()
     
-    def _type_content_with_smart_timing(self, content: str) -> None:
-        """Type content with smart timing that works with IDE auto-indentation without navigation keys."""
-        if self.debug:
-            print("[DEBUG] Using smart timing method - no navigation keys, just intelligent delays")
+    def _press_tabs(self, count: int) -> None:
+        """Press Tab count times (tabs need real key events, not typed text)."""
+        tap = self.keyboard_controller.tap
+        for _ in range(count):
+            tap(Key.tab)
+    
+    def _typing_plan(self, content: str) -> Optional[tuple]:
+        """Split content into per-line (indent width, indent runs) for smart line typing.
         
-        try:
-            # Pre-process content to work with IDE auto-indentation
-            processed_content = self._preprocess_for_ide_indentation(content)
-            
-            if self.debug:
-                print(f"[DEBUG] Pre-processed content to work with IDE auto-indentation")
-                print(f"[DEBUG] Original lines: {len(content.split('\\n'))}, Processed lines: {len(processed_content.split('\\n'))}")
-            
-            # Use write with smart interval timing
-            # Slightly longer delay for newlines to let IDE auto-indent settle
-            if self.debug:
-                print(f"[DEBUG] Typing {len(processed_content)} characters with smart timing")
-            
-            # Type character by character with smart delays
-            for i, char in enumerate(processed_content):
-                pyautogui.write(char)
-                
-                if char == '\n':
-                    # Longer delay after newlines to let IDE auto-indent settle
-                    time.sleep(self.delay * 3)
-                else:
-                    # Normal delay for other characters
-                    time.sleep(self.delay)
-                
-                # Progress reporting
-                if (i + 1) % 100 == 0:
-                    print(f"Progress: {i + 1}/{len(processed_content)} characters typed")
-            
-            print(f"✓ Successfully typed {len(processed_content)} characters using smart timing method!")
-            
-        except Exception as e:
-            if self.debug:
-                print(f"[DEBUG] Smart timing method failed: {e}, falling back to basic write")
-            # Final fallback to basic write
-            pyautogui.write(content, interval=self.delay)
-            print(f"✓ Successfully typed {len(content)} characters using fallback write method!")
-    
-    def _preprocess_for_ide_indentation(self, content: str) -> str:
-        """Simple IDE-aware preprocessing: retain original indentation but account for IDE auto-indent on next line."""
-        lines = content.split('\n')
-        processed_lines = []
+        Returns None for content that doesn't need smart indentation handling.
+        Plans for the last few contents are cached under a digest of the content,
+        so re-triggering with the same clipboard skips the line analysis without
+        keeping the clipboard text itself alive.
+        """
+        if '\n' not in content or not _INDENTED_LINE_RE.search(content):
+            return None
         
-        if self.debug:
-            print(f"[DEBUG] Simple IDE-aware preprocessing for {len(lines)} lines")
+        cache = self._plan_cache
+        key = hashlib.sha256(content.encode('utf-8', 'surrogatepass')).digest()
+        if key in cache:
+            # Move to the end so the least recently used plan is evicted first
+            plan = cache.pop(key)
+            cache[key] = plan
+            return plan
         
-        for i, line in enumerate(lines):
-            if i == 0:
-                # Keep first line exactly as-is
-                processed_lines.append(line)
-                if self.debug:
-                    print(f"[DEBUG] Line 1: Keep as-is: '{line[:30]}...'")
+        # The first line is typed as-is; later lines retype their indentation after Home
+        entries = [(0, ())]
+        for line in content.split('\n')[1:]:
+            width = len(line) - len(line.lstrip())
+            indent = line[:width]
+            if not indent:
+                runs = ()
+            elif '\t' not in indent:
+                # Pure spaces (the common case) are a single run; skip the regex
+                runs = (indent,)
             else:
-                # Check if previous line ends with ':' (triggers IDE auto-indent)
-                previous_line = lines[i-1] if i > 0 else ""
-                ide_will_auto_indent = previous_line.strip().endswith(':')
-                
-                if line.strip():  # Non-empty line
-                    # Get original indentation
-                    leading_spaces = len(line) - len(line.lstrip())
-                    content_part = line.lstrip()
-                    
-                    if ide_will_auto_indent and leading_spaces >= 4:
-                        # IDE will add 4 spaces, so subtract 4 from original
-                        adjusted_spaces = leading_spaces - 4
-                        adjusted_indent = ' ' * adjusted_spaces
-                        processed_line = adjusted_indent + content_part
-                        
-                        if self.debug:
-                            print(f"[DEBUG] Line {i+1}: IDE auto-indent, {leading_spaces}→{adjusted_spaces} spaces: '{processed_line[:30]}...'")
-                    else:
-                        # No IDE auto-indent expected, keep original
-                        processed_line = line
-                        
-                        if self.debug:
-                            print(f"[DEBUG] Line {i+1}: No auto-indent, keep original: '{line[:30]}...'")
-                    
-                    processed_lines.append(processed_line)
-                else:
-                    # Empty line - keep as empty
-                    processed_lines.append('')
-                    if self.debug:
-                        print(f"[DEBUG] Line {i+1}: Empty line")
+                runs = tuple(_INDENT_RUN_RE.findall(indent))
+            entries.append((width, runs))
+        plan = tuple(entries)
         
-        result = '\n'.join(processed_lines)
-        
-        if self.debug:
-            print(f"[DEBUG] Simple IDE-aware preprocessing completed")
-            print(f"[DEBUG] Sample transformation:")
-            for i in range(min(3, len(lines))):
-                orig = repr(lines[i][:40] + ('...' if len(lines[i]) > 40 else ''))
-                proc = repr(result.split('\n')[i][:40] + ('...' if len(result.split('\n')[i]) > 40 else ''))
-                print(f"[DEBUG]   {i+1}: {orig} → {proc}")
-        
-        return result
+        if len(cache) >= _PLAN_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = plan
+        return plan
     
-    def _type_content_smart_lines(self, content: str) -> None:
+    def _type_content_smart_lines(self, content: str, plan: tuple) -> None:
         """Hybrid approach: pynput for indentation handling, PyAutoGUI for content typing."""
-        if self.debug:
-            print("[DEBUG] Using hybrid approach - pynput for indentation, PyAutoGUI for content")
+        self._dbg("Using hybrid approach - pynput for indentation, PyAutoGUI for content")
         
-        lines = content.split('\n')
+        n_chars = len(content)
         total_chars = 0
+        next_report = 100
         
-        for line_num, line in enumerate(lines):
-            if line_num > 0:
-                # Press Enter to go to new line (use PyAutoGUI for this)
-                pyautogui.press('enter')
-                total_chars += 1
-                
-                if self.delay > 0:
-                    time.sleep(self.delay)
-                
-                # Handle indentation using original working pynput method
-                leading_whitespace = len(line) - len(line.lstrip())
-                if leading_whitespace > 0:
-                    if self.debug:
-                        print(f"[DEBUG] Line {line_num + 1}: Handling {leading_whitespace} spaces indentation with pynput")
+        try:
+            for line_num, ((leading_whitespace, indent_runs), line) in enumerate(zip(plan, content.split('\n'))):
+                text = line[leading_whitespace:]
+                if line_num > 0:
+                    # Press Enter to go to new line
+                    self.keyboard_controller.tap(Key.enter)
+                    total_chars += 1
                     
-                    # Use pynput for navigation (proven working method)
-                    self.keyboard_controller.press(Key.home)
-                    self.keyboard_controller.release(Key.home)
+                    # At spin-wait speeds Home follows Enter back-to-back and the
+                    # Enter slot is folded into the wait after Home
+                    back_to_back = leading_whitespace > 0 and self.delay <= _SPIN_WAIT_DELAY
+                    if self.delay > 0 and not back_to_back:
+                        self._wait_next()
                     
-                    if self.delay > 0:
-                        time.sleep(self.delay * 2)
-                    
-                    # Recreate exact indentation using pynput
-                    for i in range(leading_whitespace):
-                        if i < len(line) and line[i] == '\t':
-                            self.keyboard_controller.press(Key.tab)
-                            self.keyboard_controller.release(Key.tab)
-                        else:
-                            self.keyboard_controller.type(' ')
+                    # Handle indentation using original working pynput method
+                    if leading_whitespace > 0:
+                        if self.debug:
+                            self._dbg(f"Line {line_num + 1}: Handling {leading_whitespace} spaces indentation with pynput")
+                        
+                        # Use pynput for navigation (proven working method)
+                        self.keyboard_controller.tap(Key.home)
                         
                         if self.delay > 0:
-                            time.sleep(self.delay)
-                    
-                    total_chars += leading_whitespace
-                    
-                    # Type content part using PyAutoGUI (interference-free)
-                    content_part = line.lstrip()
-                    if content_part:
-                        if self.debug:
-                            print(f"[DEBUG] Line {line_num + 1}: Typing content with PyAutoGUI: '{content_part[:40]}...'")
+                            self._wait_next(3 if back_to_back else 2)
                         
-                        pyautogui.write(content_part, interval=self.delay)
-                        total_chars += len(content_part)
-                else:
-                    # No indentation, type whole line with PyAutoGUI
-                    if line.strip():
-                        if self.debug:
-                            print(f"[DEBUG] Line {line_num + 1}: No indentation, typing with PyAutoGUI: '{line[:40]}...'")
+                        # Recreate exact indentation using pynput, one call per run of tabs or spaces
+                        for run in indent_runs:
+                            if run[0] == '\t':
+                                self._press_tabs(len(run))
+                            else:
+                                self.keyboard_controller.type(' ' * len(run))
+
+                        if self.delay > 0:
+                            self._wait_next()
                         
-                        pyautogui.write(line, interval=self.delay)
-                        total_chars += len(line)
-            else:
-                # First line - use PyAutoGUI
-                if self.debug:
-                    print(f"[DEBUG] Line 1: Typing with PyAutoGUI: '{line[:40]}...'")
+                        total_chars += leading_whitespace
+                        
+                        # Type content part using PyAutoGUI (interference-free)
+                        if text:
+                            if self.debug:
+                                self._dbg(f"Line {line_num + 1}: Typing content with PyAutoGUI: '{text[:40]}...'")
+                            
+                            self._write_text(text)
+                            total_chars += len(text)
+                    else:
+                        # No indentation, type whole line with PyAutoGUI
+                        if text:
+                            if self.debug:
+                                self._dbg(f"Line {line_num + 1}: No indentation, typing with PyAutoGUI: '{text[:40]}...'")
+                            
+                            self._write_text(text)
+                            total_chars += len(text)
+                else:
+                    # First line - use PyAutoGUI
+                    if self.debug:
+                        self._dbg(f"Line 1: Typing with PyAutoGUI: '{text[:40]}...'")
+                    
+                    self._write_text(text)
+                    total_chars += len(text)
                 
-                pyautogui.write(line, interval=self.delay)
-                total_chars += len(line)
-            
-            # Print progress every 100 characters
-            if total_chars % 100 == 0:
-                print(f"Progress: {total_chars}/{len(content)} characters typed")
+                # Print progress every 100 characters
+                if total_chars >= next_report:
+                    self._show_progress(total_chars, n_chars)
+                    next_report = (total_chars // 100 + 1) * 100
+        finally:
+            self._end_progress()
         
-        print(f"✓ Successfully typed {len(content)} characters with hybrid approach!")
+        print(f"✓ Successfully typed {n_chars} characters with hybrid approach!")
     
     def _type_content_character_fallback(self, content: str) -> None:
-        """Fallback character-by-character typing for content that pyautogui.write() can't handle."""
-        if self.debug:
-            print("[DEBUG] Using character-by-character fallback method")
+        """Fallback key-by-key typing through pynput, for content that pyautogui.write() can't handle."""
+        self._dbg("Using character-by-character fallback method")
         
-        lines = content.split('\n')
+        n_chars = len(content)
         total_chars = 0
+        next_report = 100
         
-        for line_num, line in enumerate(lines):
-            if line_num > 0:
-                # Press Enter to go to new line
-                pyautogui.press('enter')
-                total_chars += 1
+        try:
+            # Stream the lines rather than holding a split copy of a large paste
+            for line_num, line in enumerate(_iter_lines(content)):
+                if line_num > 0:
+                    # Press Enter to go to new line
+                    self.keyboard_controller.tap(Key.enter)
+                    total_chars += 1
+                    
+                    if self.delay > 0:
+                        self._wait_next()
                 
-                if self.delay > 0:
-                    time.sleep(self.delay)
-            
-            # Type the line content
-            for char in line:
-                if char == '\t':
-                    pyautogui.press('tab')
-                else:
-                    # Use individual key press/release to avoid hotkey conflicts
-                    success = self._type_character_safe(char)
-                    if not success:
-                        if self.debug:
-                            print(f"[DEBUG] Could not type character '{char}', skipping")
+                # Type the line content in runs: plain keys in one pynput call paced
+                # as a whole, shifted keys with Shift held once across the run
+                for kind, run in groupby(line, key=_run_kind):
+                    if kind == _RUN_PLAIN:
+                        run = ''.join(run)
+                        self.keyboard_controller.type(run)
+                        if self.delay > 0:
+                            self._wait_next(len(run))
                         continue
+                    
+                    shifted = kind == _RUN_SHIFT
+                    if shifted:
+                        self._shift_down()
+                    try:
+                        for char in run:
+                            if char == '\t':
+                                self.keyboard_controller.tap(Key.tab)
+                            else:
+                                # Use individual key press/release to avoid hotkey conflicts
+                                success = self._type_character_safe(char, shift_held=shifted)
+                                if not success:
+                                    if self.debug:
+                                        self._dbg(f"Could not type character '{char}', skipping")
+                                    continue
+                            
+                            # Add delay between keystrokes
+                            if self.delay > 0:
+                                self._wait_next()
+                    finally:
+                        if shifted:
+                            self._shift_up()
                 
-                # Add delay between keystrokes
-                if self.delay > 0:
-                    time.sleep(self.delay)
-                
-                total_chars += 1
-                
-                # Print progress every 100 characters
-                if total_chars % 100 == 0:
-                    print(f"Progress: {total_chars}/{len(content)} characters typed")
+                # Print progress every 100 characters, checked once per line
+                total_chars += len(line)
+                if total_chars >= next_report:
+                    self._show_progress(total_chars, n_chars)
+                    next_report = (total_chars // 100 + 1) * 100
+        finally:
+            self._end_progress()
         
-        print(f"✓ Successfully typed {len(content)} characters using character fallback method!")
+        print(f"✓ Successfully typed {n_chars} characters using character fallback method!")
+    
+    def _shift_down(self) -> None:
+        """Hold Shift, settling for modifier_sleep if set."""
+        self.keyboard_controller.press(Key.shift)
+        if self.modifier_sleep:
+            time.sleep(self.modifier_sleep)
+    
+    def _shift_up(self) -> None:
+        """Release Shift, settling for modifier_sleep first if set."""
+        if self.modifier_sleep:
+            time.sleep(self.modifier_sleep)
+        self.keyboard_controller.release(Key.shift)
     
-    def _type_character_safe(self, char: str) -> bool:
-        """Type a single character using safer key press/release method."""
+    def _type_character_safe(self, char: str, shift_held: bool = False) -> bool:
+        """Type a single character using safer key press/release method.
+        
+        Args:
+            char: The character to type
+            shift_held: Caller is already holding Shift, so shifted characters
+                only need their base key pressed
+        """
         try:
             # Check if we have a mapping for this character
-            if char in MACOS_KEY_MAPPING:
-                base_key, modifiers = MACOS_KEY_MAPPING[char]
-                
-                if self.debug:
-                    modifier_names = [str(mod).split('.')[-1] for mod in modifiers]
-                    print(f"[DEBUG] Typing '{char}' using safe method: {base_key} + {modifier_names if modifier_names else 'none'}")
-                
-                if Key.shift in modifiers:
-                    # Use individual key press/release instead of hotkey to avoid conflicts
-                    try:
-                        pyautogui.keyDown('shift')
-                        time.sleep(0.01)  # Small delay
-                        pyautogui.press(base_key)
-                        time.sleep(0.01)  # Small delay
-                        pyautogui.keyUp('shift')
-                        
-                        if self.debug:
-                            print(f"[DEBUG] Successfully typed '{char}' using safe shift method")
-                        return True
-                    except Exception as e:
-                        if self.debug:
-                            print(f"[DEBUG] Safe shift method failed for '{char}': {e}")
-                        return False
-                else:
-                    # No modifiers needed, just press the base key
-                    try:
-                        pyautogui.press(base_key)
-                        if self.debug:
-                            print(f"[DEBUG] Successfully typed base key '{base_key}' using safe method")
-                        return True
-                    except Exception as e:
-                        if self.debug:
-                            print(f"[DEBUG] Safe press failed for '{base_key}': {e}")
-                        return False
-                
-            else:
+            o = ord(char)
+            entry = _ASCII_KEY_MAP[o] if o < 128 else MACOS_KEY_MAPPING.get(char)
+            if entry is None:
                 # Character not in mapping - try pyautogui.write for single character
+                pyautogui.write(char)
+                return True
+            
+            base_key, needs_shift = entry
+            if self.debug:
+                self._dbg(f"Typing '{char}' using safe method: {base_key} + {'shift' if needs_shift else 'none'}")
+            
+            if needs_shift and not shift_held:
+                # Individual Shift press/release instead of a hotkey to avoid conflicts
+                self._shift_down()
                 try:
-                    pyautogui.write(char)
-                    return True
-                except Exception as e:
-                    if self.debug:
-                        print(f"[DEBUG] Character '{char}' not in mapping and write failed: {e}")
-                    return False
-                
+                    self.keyboard_controller.tap(base_key)
+                finally:
+                    self._shift_up()
+            else:
+                self.keyboard_controller.tap(base_key)
+            return True
         except Exception as e:
             if self.debug:
-                print(f"[DEBUG] Failed to type character '{char}': {e}")
+                self._dbg(f"Failed to type character '{char}': {e}")
+            return False
+    
+    def _paste_with_xdotool(self) -> bool:
+        """Send Ctrl+V with xdotool; returns False if xdotool is unavailable or fails."""
+        if _XDOTOOL is None:
+            return False
+        try:
+            # --clearmodifiers releases the still-held trigger modifiers for the paste
+            subprocess.run([_XDOTOOL, 'key', '--clearmodifiers', 'ctrl+v'], check=True, timeout=_XDOTOOL_TIMEOUT)
+            return True
+        except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            self._dbg(f"xdotool paste failed: {e}, falling back to pynput")
             return False
     
     def _type_content_traditional(self, content: str) -> None:
@@ -808,22 +1114,22 @@ class ProKeys:
     def on_key_press(self, key):
         """Handle key press events."""
         try:
-            # Convert character keys to lowercase for consistent matching
-            if hasattr(key, 'char') and key.char:
-                processed_key = key.char.lower()
-            else:
-                processed_key = key
-                
-            self.pressed_keys.add(processed_key)
+            # Character keys are looked up by char (both cases are in _key_bit)
+            char = getattr(key, 'char', None)
+            bit = self._key_bit.get(char if char else key)
+            # Keys outside the trigger combination have no bit and can't complete it
+            if not bit:
+                return
+            self._pressed_mask |= bit
             
             # Debug: Print key press (uncomment for debugging)
-            # print(f"Key pressed: {processed_key} | Currently pressed: {self.pressed_keys}")
+            # print(f"Key pressed: {key} | Pressed mask: {self._pressed_mask:#x}")
             
-            # Check if trigger combination is pressed
-            if self.trigger_keys.issubset(self.pressed_keys):
+            # Check if trigger combination is pressed (only when its last key goes down)
+            if bit & self._trigger_last_bits and (self._pressed_mask & self._trigger_mask) == self._trigger_mask:
                 print(f"\n🚀 Trigger activated! Reading clipboard and typing content...")
-                # Run typing in a separate thread to avoid blocking the listener
-                threading.Thread(target=self._handle_trigger, daemon=True).start()
+                # Typing (and the clipboard read) runs on the worker thread to avoid blocking the listener
+                self._request_trigger()
                 
         except UnicodeDecodeError:
             # Handle macOS pynput Unicode decode issues for special characters
@@ -837,17 +1143,14 @@ class ProKeys:
     def on_key_release(self, key):
         """Handle key release events."""
         try:
-            # Convert character keys to lowercase for consistent matching
-            if hasattr(key, 'char') and key.char:
-                processed_key = key.char.lower()
-            else:
-                processed_key = key
-                
-            # Remove key from pressed keys set
-            self.pressed_keys.discard(processed_key)
+            # Clear the key's bit from the pressed mask
+            char = getattr(key, 'char', None)
+            bit = self._key_bit.get(char if char else key)
+            if bit:
+                self._pressed_mask &= ~bit
             
             # Debug: Print key release (uncomment for debugging)
-            # print(f"Key released: {processed_key} | Currently pressed: {self.pressed_keys}")
+            # print(f"Key released: {key} | Pressed mask: {self._pressed_mask:#x}")
             
             # Exit ONLY on actual Escape key - be very specific
             if key == Key.esc:
@@ -869,12 +1172,31 @@ class ProKeys:
             # This can happen with certain special keys on macOS
             pass
     
+    def _request_trigger(self):
+        """Queue a trigger for the worker without blocking; a pending one already covers it."""
+        try:
+            self._trigger_queue.put_nowait(True)
+        except queue.Full:
+            pass
+    
+    def _trigger_worker(self):
+        """Run _handle_trigger for each queued trigger until listening stops."""
+        while True:
+            self._trigger_queue.get()
+            if not self.running:
+                return
+            try:
+                self._handle_trigger()
+            except Exception as e:
+                # Keep the worker alive so later triggers are still handled
+                print(f"✗ Error handling trigger: {e}")
+    
     def _handle_trigger(self):
         """Handle the trigger key combination."""
         content = self.get_clipboard_content()
         if content:
             # Clear pressed keys to avoid interference
-            self.pressed_keys.clear()
+            self._pressed_mask = 0
             self.type_content(content)
         else:
             print("No content found in clipboard.")
@@ -889,13 +1211,20 @@ class ProKeys:
         print("-" * 50)
         
         self.running = True
+        # One long-lived worker types the clipboard, instead of a new thread per trigger
+        threading.Thread(target=self._trigger_worker, daemon=True).start()
         
-        with Listener(
-            on_press=self.on_key_press,
-            on_release=self.on_key_release
-        ) as listener:
-            self.listener = listener
-            listener.join()
+        try:
+            with Listener(
+                on_press=self.on_key_press,
+                on_release=self.on_key_release
+            ) as listener:
+                self.listener = listener
+                listener.join()
+        finally:
+            # Wake the worker so it sees running is False and exits
+            self.running = False
+            self._request_trigger()
     
     def test_character_mapping(self):
         """Test the character mapping to ensure all common characters are supported."""
@@ -917,21 +1246,22 @@ class ProKeys:
         
         total_chars = 0
         supported_chars = 0
-        unsupported_chars = []
+        unsupported_chars = set()
         
         for test_text, description in test_cases:
             print(f"  Testing: {description}")
             for char in test_text:
                 total_chars += 1
-                if char in MACOS_KEY_MAPPING:
+                o = ord(char)
+                entry = _ASCII_KEY_MAP[o] if o < 128 else MACOS_KEY_MAPPING.get(char)
+                if entry is not None:
                     supported_chars += 1
-                    base_key, modifiers = MACOS_KEY_MAPPING[char]
-                    modifier_names = [str(mod).split('.')[-1] for mod in modifiers]
                     if self.debug:
-                        print(f"    '{char}' -> {base_key} + {modifier_names if modifier_names else 'none'}")
+                        base_key, needs_shift = entry
+                        print(f"    '{char}' -> {base_key} + {'shift' if needs_shift else 'none'}")
                 else:
-                    if char not in unsupported_chars and char not in ['\n', '\t']:
-                        unsupported_chars.append(char)
+                    if char not in _CONTROL_CHARS:
+                        unsupported_chars.add(char)
         
         coverage = (supported_chars / total_chars) * 100
         print(f"\n📊 Character Mapping Coverage:")
@@ -940,28 +1270,21 @@ class ProKeys:
         print(f"  Coverage: {coverage:.1f}%")
         
         if unsupported_chars:
-            print(f"  ⚠️  Unsupported characters (will use fallback): {unsupported_chars}")
+            print(f"  ⚠️  Unsupported characters (will use fallback): {sorted(unsupported_chars)}")
         else:
             print(f"  ✅ All test characters are supported!")
         
         # Test specific shift combinations
         print(f"\n🔢 Testing shift number combinations:")
-        shift_tests = {
-            '1': '!', '2': '@', '3': '#', '4': '$', '5': '%',
-            '6': '^', '7': '&', '8': '*', '9': '(', '0': ')'
-        }
-        
-        for base, expected in shift_tests.items():
-            if expected in MACOS_KEY_MAPPING:
-                mapped_base, modifiers = MACOS_KEY_MAPPING[expected]
-                shift_used = Key.shift in modifiers
-                correct_base = mapped_base == base
-                if shift_used and correct_base:
-                    print(f"  ✅ {base} + Shift = {expected}")
-                else:
-                    print(f"  ❌ {base} + Shift = {expected} (mapping issue)")
-            else:
+        for expected, entry in _SHIFT_NUM_TESTS.items():
+            base = entry[0]
+            mapped = MACOS_KEY_MAPPING.get(expected)
+            if mapped is None:
                 print(f"  ❌ {expected} not in mapping")
+            elif mapped == entry:
+                print(f"  ✅ {base} + Shift = {expected}")
+            else:
+                print(f"  ❌ {base} + Shift = {expected} (mapping issue)")
         
         print(f"\n✅ Character mapping test completed!")
         return coverage > 95  # Return True if coverage is good
@@ -970,18 +1293,74 @@ class ProKeys:
         """Paste clipboard content once and exit."""
         print("🎯 ProKeys - One-time paste mode")
         content = self.get_clipboard_content()
+        if not content:
+            print("No content found in clipboard.")
+            return
         self.type_content(content)
 
 
+# Arguments the --once fast path in main() handles without argparse
+_ONCE_FAST_ARGS = frozenset(('--once', '--debug'))
+
+
+def _run_prokeys(delay: float, trigger_key: str, windows_mode: bool = False,
+                 debug: bool = False, paste_mode: bool = False, once: bool = False) -> None:
+    """Print the startup settings, then paste once or listen for the trigger."""
+    # Validate delay
+    if delay < 0:
+        print("Error: Delay cannot be negative")
+        sys.exit(1)
+    
+    # Show current settings
+    wpm = 12.0 / delay if delay > 0 else 999
+    print(f"⚡ ProKeys starting with {wpm:.0f} WPM (delay: {delay:.4f}s)")
+    if windows_mode:
+        print(f"🪟 Windows mode enabled - using clipboard-based input for maximum compatibility")
+    elif paste_mode:
+        print("📋 Paste mode enabled - pasting via clipboard instead of typing")
+    if debug:
+        print("🐛 Debug mode enabled - will show input method details")
+    
+    try:
+        prokeys = ProKeys(delay=delay, trigger_key=trigger_key, windows_mode=windows_mode, debug=debug, paste_mode=paste_mode)
+        
+        if once:
+            prokeys.paste_once()
+        else:
+            prokeys.start_listening()
+            
+    except KeyboardInterrupt:
+        print("\n👋 ProKeys terminated by user.")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
 def main():
+    argv = sys.argv[1:]
+    
     # Check if config subcommand is used
-    if len(sys.argv) > 1 and sys.argv[1] == "config":
+    if argv and argv[0] == "config":
         interactive_config()
         return
     
+    # Show config without building the parser
+    if argv == ['--show-config']:
+        show_config()
+        return
+    
     # Load configuration
     config = load_config()
     
+    # Fast path for one-shot pastes (e.g. launched from a shortcut): skip argparse entirely
+    if '--once' in argv and _ONCE_FAST_ARGS.issuperset(argv):
+        _run_prokeys(config['delay'], config['trigger_key'], config.get('windows_mode', False),
+                     debug='--debug' in argv, once=True)
+        return
+    
+    import argparse  # Only needed past the fast paths above
+    
+    
     parser = argparse.ArgumentParser(
         description="ProKeys - Clipboard Content Keystroke Emulator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -992,6 +1371,7 @@ Examples:
     python prokeys.py --delay 0.02             # Override delay (slower typing)
     python prokeys.py --trigger-key "ctrl+alt+v"  # Custom trigger key
     python prokeys.py --once                    # Paste once and exit
+    python prokeys.py --paste-mode              # Paste via clipboard (single keystroke)
 
 Configuration:
     Current: {config['typing_speed_wpm']} WPM, Delay: {config['delay']:.4f}s
@@ -1032,6 +1412,12 @@ Configuration:
         help=f'Use Windows keyboard layout mode (config: {config.get("windows_mode", False)})'
     )
     
+    parser.add_argument(
+        '--paste-mode',
+        action='store_true',
+        help='Paste via the clipboard with a single Cmd/Ctrl+V instead of typing each character'
+    )
+    
     parser.add_argument(
         '--debug',
         action='store_true',
@@ -1064,32 +1450,7 @@ Configuration:
             print("\n⚠️  Some issues found in character mapping. See details above.")
             sys.exit(1)
     
-    # Validate delay
-    if args.delay < 0:
-        print("Error: Delay cannot be negative")
-        sys.exit(1)
-    
-    # Show current settings
-    delay_to_wpm = 12.0 / args.delay if args.delay > 0 else 999
-    print(f"⚡ ProKeys starting with {delay_to_wpm:.0f} WPM (delay: {args.delay:.4f}s)")
-    if args.windows_mode:
-        print(f"🪟 Windows mode enabled - using clipboard-based input for maximum compatibility")
-    if args.debug:
-        print("🐛 Debug mode enabled - will show input method details")
-    
-    try:
-        prokeys = ProKeys(delay=args.delay, trigger_key=args.trigger_key, windows_mode=args.windows_mode, debug=args.debug)
-        
-        if args.once:
-            prokeys.paste_once()
-        else:
-            prokeys.start_listening()
-            
-    except KeyboardInterrupt:
-        print("\n👋 ProKeys terminated by user.")
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    _run_prokeys(args.delay, args.trigger_key, args.windows_mode, args.debug, args.paste_mode, args.once)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,261 @@
+import enum
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import prokeys
+
+
+def test_delay_to_wpm_continuous_at_fast_edge():
+    edge = prokeys._DELAYS_SORTED[0]
+    assert prokeys.delay_to_wpm(edge) == 5000
+    assert abs(prokeys.delay_to_wpm(edge * 0.999) - 5000) <= 10
+
+
+def test_delay_to_wpm_continuous_at_slow_edge():
+    edge = prokeys._DELAYS_SORTED[-1]
+    assert prokeys.delay_to_wpm(edge) == 99
+    assert abs(prokeys.delay_to_wpm(edge * 1.001) - 99) <= 1
+
+
+def test_delay_to_wpm_round_trips_outside_table():
+    for wpm in (30, 60, 98, 5001, 8000):
+        assert prokeys.delay_to_wpm(prokeys._compute_wpm_delay(wpm)) == wpm
+
+
+def test_migrate_partial_legacy_config(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(prokeys, "_CFG_CACHE", None)
+    monkeypatch.setattr(prokeys, "_CFG_MTIME", 0)
+    (tmp_path / prokeys.LEGACY_CONFIG_FILE).write_text('{"typing_speed_wpm": 120}')
+
+    config = prokeys.load_config()
+
+    assert config["typing_speed_wpm"] == 120
+    assert config["delay"] == prokeys.wpm_to_delay(120)
+    assert config["trigger_key"] == prokeys._DEFAULT_CONFIG["trigger_key"]
+    assert config["windows_mode"] is False
+    assert not (tmp_path / prokeys.LEGACY_CONFIG_FILE).exists()
+
+    monkeypatch.setattr(prokeys, "_CFG_CACHE", None)
+    assert prokeys.load_config() == config
+
+
+def test_migrate_keeps_config_when_legacy_file_cannot_be_removed(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(prokeys, "_CFG_CACHE", None)
+    monkeypatch.setattr(prokeys, "_CFG_MTIME", 0)
+    (tmp_path / prokeys.LEGACY_CONFIG_FILE).write_text('{"typing_speed_wpm": 300}')
+
+    def deny(path):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(prokeys.os, "remove", deny)
+
+    assert prokeys.load_config()["typing_speed_wpm"] == 300
+    assert "Error removing legacy config" in capsys.readouterr().out
+
+
+def test_pack_unpack_config_round_trip():
+    config = {
+        "typing_speed_wpm": 4321,
+        "delay": 0.0125,
+        "trigger_key": "k" * 32,
+        "windows_mode": True,
+    }
+    data = prokeys._pack_config(config)
+
+    assert len(data) == prokeys._CONFIG_STRUCT.size
+    assert prokeys._unpack_config(data) == config
+
+
+def test_pack_config_round_trips_multibyte_trigger_key():
+    config = dict(prokeys._DEFAULT_CONFIG, trigger_key="cmd+§")
+
+    assert prokeys._unpack_config(prokeys._pack_config(config)) == config
+
+
+def test_pack_config_rejects_trigger_key_over_32_bytes():
+    config = dict(prokeys._DEFAULT_CONFIG, trigger_key="k" * 31 + "§")
+
+    with pytest.raises(ValueError):
+        prokeys._pack_config(config)
+
+
+class _FakeKey(enum.Enum):
+    ctrl = 'ctrl'
+    ctrl_l = 'ctrl_l'
+    ctrl_r = 'ctrl_r'
+    shift = 'shift'
+    shift_l = 'shift_l'
+    shift_r = 'shift_r'
+    alt = 'alt'
+    alt_l = 'alt_l'
+    alt_r = 'alt_r'
+    cmd = 'cmd'
+    cmd_l = 'cmd_l'
+    cmd_r = 'cmd_r'
+    esc = 'esc'
+    enter = 'enter'
+    home = 'home'
+    tab = 'tab'
+    space = 'space'
+
+
+class _FakeKeyCode:
+    def __init__(self, char):
+        self.char = char
+
+
+class _FakeController:
+    def press(self, key):
+        pass
+
+    def release(self, key):
+        pass
+
+    def tap(self, key):
+        pass
+
+    def type(self, text):
+        pass
+
+
+@pytest.fixture
+def fake_input_libs(monkeypatch):
+    """Install stand-in keyboard and clipboard modules for _load_input_libs."""
+    keyboard = types.ModuleType("pynput.keyboard")
+    keyboard.Key = _FakeKey
+    keyboard.Listener = object
+    keyboard.Controller = _FakeController
+    pynput = types.ModuleType("pynput")
+    pynput.keyboard = keyboard
+    monkeypatch.setitem(sys.modules, "pynput", pynput)
+    monkeypatch.setitem(sys.modules, "pynput.keyboard", keyboard)
+    monkeypatch.setitem(sys.modules, "pyautogui", types.ModuleType("pyautogui"))
+    monkeypatch.setitem(sys.modules, "pyperclip", types.ModuleType("pyperclip"))
+    monkeypatch.setitem(sys.modules, "Quartz", None)
+    for name in ("pyperclip", "pyautogui", "Quartz", "Key", "Listener", "Controller", "_KEYBOARD_CONTROLLER"):
+        monkeypatch.setattr(prokeys, name, None)
+
+
+def _triggers(app):
+    """Number of triggers queued since the last call (the queue holds at most one)."""
+    count = 0
+    while not app._trigger_queue.empty():
+        app._trigger_queue.get_nowait()
+        count += 1
+    return count
+
+
+def _press(app, *keys):
+    for key in keys:
+        app.on_key_press(_FakeKeyCode(key) if isinstance(key, str) else key)
+
+
+def _release(app, *keys):
+    for key in keys:
+        app.on_key_release(_FakeKeyCode(key) if isinstance(key, str) else key)
+
+
+def test_trigger_fires_on_shifted_letter(fake_input_libs):
+    app = prokeys.ProKeys(trigger_key="cmd+shift+v")
+
+    # With Shift held the letter arrives as 'V'; either side's modifiers count
+    _press(app, _FakeKey.cmd_r, _FakeKey.shift_l, "V")
+
+    assert _triggers(app) == 1
+
+
+def test_trigger_refires_when_letter_is_pressed_again(fake_input_libs):
+    app = prokeys.ProKeys(trigger_key="cmd+shift+v")
+
+    _press(app, _FakeKey.cmd, _FakeKey.shift, "V")
+    assert _triggers(app) == 1
+    _release(app, "V")
+    assert _triggers(app) == 0
+    _press(app, "V")
+    assert _triggers(app) == 1
+
+
+def test_trigger_fires_only_when_the_letter_goes_down_last(fake_input_libs):
+    app = prokeys.ProKeys(trigger_key="cmd+shift+v")
+
+    _press(app, "v", _FakeKey.cmd, _FakeKey.shift)
+    assert _triggers(app) == 0
+
+    _release(app, _FakeKey.cmd)
+    _press(app, _FakeKey.cmd)
+    assert _triggers(app) == 0
+
+
+def test_trigger_ignores_keys_outside_the_combination(fake_input_libs):
+    app = prokeys.ProKeys(trigger_key="cmd+shift+v")
+
+    _press(app, _FakeKey.cmd, "x", _FakeKey.enter)
+    assert app._pressed_mask == app._key_bit[_FakeKey.cmd]
+    _press(app, _FakeKey.shift, "V")
+    assert _triggers(app) == 1
+
+
+def test_modifier_only_trigger_fires_on_the_last_modifier(fake_input_libs):
+    app = prokeys.ProKeys(trigger_key="ctrl+shift")
+
+    _press(app, _FakeKey.ctrl_l)
+    assert _triggers(app) == 0
+    _press(app, _FakeKey.shift_r)
+    assert _triggers(app) == 1
+
+    _release(app, _FakeKey.shift_r)
+    _press(app, _FakeKey.shift)
+    assert _triggers(app) == 1
+
+
+def _plan(content, cache=None):
+    holder = types.SimpleNamespace(_plan_cache={} if cache is None else cache)
+    return prokeys.ProKeys._typing_plan(holder, content)
+
+
+def test_typing_plan_splits_indentation_into_tab_and_space_runs():
+    plan = _plan("if x:\n\t  a\n    b\n  \t\tc\nd")
+
+    assert plan == (
+        (0, ()),
+        (3, ("\t", "  ")),
+        (4, ("    ",)),
+        (4, ("  ", "\t\t")),
+        (0, ()),
+    )
+
+
+def test_typing_plan_keeps_whitespace_only_lines():
+    plan = _plan("def f():\n    \n\n    return 1")
+
+    assert plan == ((0, ()), (4, ("    ",)), (0, ()), (4, ("    ",)))
+
+
+def test_typing_plan_is_none_without_indented_lines():
+    cache = {}
+
+    assert _plan("one line", cache) is None
+    assert _plan("two\nlines", cache) is None
+    assert cache == {}
+
+
+def test_typing_plan_cache_evicts_least_recently_used():
+    cache = {}
+    contents = [f"block{i}:\n    line" for i in range(prokeys._PLAN_CACHE_SIZE + 1)]
+    plans = [_plan(content, cache) for content in contents[:-1]]
+
+    # Touch the oldest so the second one becomes least recently used
+    assert _plan(contents[0], cache) is plans[0]
+    _plan(contents[-1], cache)
+
+    assert len(cache) == prokeys._PLAN_CACHE_SIZE
+    assert _plan(contents[0], cache) is plans[0]
+    assert _plan(contents[1], cache) is not plans[1]
+    assert contents[0] not in cache